@@ -5,11 +5,12 @@ SETUP INSTRUCTIONS:
 1. Create a new directory and save this file as 'setup_app.py'
 2. Run: python setup_app.py
 3. Follow the prompts to create the Django project structure
-4. Run migrations: python manage.py migrate
-5. Create superuser: python manage.py createsuperuser
-6. Load sample data: python manage.py loaddata initial_data.json
-7. Run server: python manage.py runserver
-8. Visit: http://127.0.0.1:8000/
+4. Install dependencies: pip install django whitenoise
+5. Run migrations: python manage.py migrate
+6. Create superuser: python manage.py createsuperuser
+7. Load sample data: python manage.py seed_vocab
+8. Run server: python manage.py runserver
+9. Visit: http://127.0.0.1:8000/
 
 This script will create a complete Django project structure with:
 - User authentication
@@ -22,6 +23,12 @@ This script will create a complete Django project structure with:
 import os
 import sys
 import json
+try:
+    import orjson
+except ImportError:  # the stdlib encoder is fine for the small bundled fixture
+    orjson = None
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 def create_project_structure():
     """Create the Django project directory structure"""
@@ -41,11 +48,19 @@ def create_project_structure():
             'urls.py': VOCABULARY_URLS_PY,
             'admin.py': ADMIN_PY,
             'forms.py': FORMS_PY,
+            'management': {
+                '__init__.py': '',
+                'commands': {
+                    '__init__.py': '',
+                    'seed_vocab.py': SEED_VOCAB_PY,
+                },
+            },
         },
         'templates': {
             'base.html': BASE_HTML,
             'vocabulary': {
                 'word_list.html': WORD_LIST_HTML,
+                'word_card.html': WORD_CARD_HTML,
                 'practice.html': PRACTICE_HTML,
                 'progress.html': PROGRESS_HTML,
             },
@@ -64,15 +79,38 @@ def create_project_structure():
         }
     }
     
-    def create_structure(base_path, structure):
+    def flatten_structure(base_path, structure, dirs, files):
         for name, content in structure.items():
             path = os.path.join(base_path, name)
             if isinstance(content, dict):
-                os.makedirs(path, exist_ok=True)
-                create_structure(path, content)
+                dirs.append(path)
+                flatten_structure(path, content, dirs, files)
             else:
-                with open(path, 'w') as f:
-                    f.write(content)
+                files.append((path, content))
+    
+    def write_file(item):
+        path, content = item
+        target = Path(path)
+        if not content:
+            # Empty stubs (__init__.py) need no write syscall, just an openat+close
+            if not target.exists():
+                target.touch()
+            return
+        data = content.encode()
+        # On re-runs, don't truncate and rewrite files that are already identical
+        if target.exists() and target.stat().st_size == len(data) and target.read_bytes() == data:
+            return
+        target.write_bytes(data)
+    
+    def create_structure(base_path, structure):
+        dirs, files = [], []
+        flatten_structure(base_path, structure, dirs, files)
+        # Directories first; they are cheap and must exist before the writes
+        for path in dirs:
+            os.makedirs(path, exist_ok=True)
+        # The writes hit distinct paths and are latency-bound, so overlap them
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(write_file, files))
     
     # Create base directory
     if not os.path.exists('language_learning_project'):
@@ -89,18 +127,21 @@ def create_project_structure():
     # Create structure
     create_structure('.', structure)
     
-    # Create initial data fixture
+    # Create initial data fixture; orjson emits bytes directly when available
     os.makedirs('vocabulary/fixtures', exist_ok=True)
-    with open('vocabulary/fixtures/initial_data.json', 'w') as f:
-        f.write(INITIAL_DATA)
+    if orjson is not None:
+        fixture_bytes = orjson.dumps(INITIAL_DATA, option=orjson.OPT_INDENT_2)
+    else:
+        fixture_bytes = json.dumps(INITIAL_DATA, indent=2).encode()
+    Path('vocabulary/fixtures/initial_data.json').write_bytes(fixture_bytes)
     
     print("✓ Project structure created successfully!")
     print("\nNext steps:")
     print("1. cd language_learning_project")
-    print("2. pip install django")
+    print("2. pip install django whitenoise")
     print("3. python manage.py migrate")
     print("4. python manage.py createsuperuser")
-    print("5. python manage.py loaddata initial_data.json")
+    print("5. python manage.py seed_vocab")
     print("6. python manage.py runserver")
     print("\nThen visit: http://127.0.0.1:8000/")
 
@@ -146,6 +187,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -181,6 +223,20 @@ DATABASES = {
     }
 }
 
+# Per-process cache that works out of the box for this dev scaffold; switch
+# to a shared Redis cache for multi-process deployments:
+# CACHES = {
+#     'default': {
+#         'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+#         'LOCATION': 'redis://127.0.0.1:6379',
+#     }
+# }
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
     {'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator'},
@@ -195,6 +251,13 @@ USE_TZ = True
 
 STATIC_URL = '/static/'
 STATICFILES_DIRS = [BASE_DIR / 'static']
+STATIC_ROOT = BASE_DIR / 'staticfiles'
+
+# WhiteNoise serves pre-compressed, hash-named assets without touching Django views
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage'},
+}
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
@@ -228,6 +291,10 @@ MODELS_PY = '''
 from django.db import models
 from django.contrib.auth.models import User
 from django.utils import timezone
+from datetime import timedelta
+
+# Review intervals per mastery level: 1 day, 3 days, 7 days, 14 days, 30 days, 60 days
+_INTERVALS = tuple(timedelta(days=d) for d in (1, 3, 7, 14, 30, 60))
 
 class Language(models.Model):
     code = models.CharField(max_length=10, unique=True)
@@ -246,6 +313,7 @@ class Word(models.Model):
     language = models.ForeignKey(Language, on_delete=models.CASCADE)
     word = models.CharField(max_length=200)
     translation = models.CharField(max_length=200)
+    translation_normalized = models.CharField(max_length=200, db_index=True, editable=False, blank=True)
     pronunciation = models.CharField(max_length=200, blank=True)
     example_sentence = models.TextField(blank=True)
     difficulty = models.CharField(max_length=20, choices=DIFFICULTY_CHOICES, default='beginner')
@@ -256,6 +324,11 @@ class Word(models.Model):
     
     def __str__(self):
         return f"{self.word} - {self.translation}"
+    
+    def save(self, *args, **kwargs):
+        # Case-fold once at write time so answer checks compare pre-normalized text
+        self.translation_normalized = self.translation.casefold().strip()
+        super().save(*args, **kwargs)
 
 class UserProgress(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
@@ -269,6 +342,10 @@ class UserProgress(models.Model):
     class Meta:
         unique_together = ['user', 'word']
         ordering = ['next_review']
+        indexes = [
+            models.Index(fields=['user', 'next_review']),
+            models.Index(fields=['user', 'mastery_level']),
+        ]
     
     def __str__(self):
         return f"{self.user.username} - {self.word.word} (Level {self.mastery_level})"
@@ -282,22 +359,28 @@ class UserProgress(models.Model):
     
     def update_progress(self, is_correct):
         """Update progress using simplified spaced repetition"""
-        from datetime import timedelta
-        
         if is_correct:
-            self.correct_count += 1
-            self.mastery_level = min(5, self.mastery_level + 1)
-            # Increase interval: 1 day, 3 days, 7 days, 14 days, 30 days, 60 days
-            intervals = [1, 3, 7, 14, 30, 60]
-            days = intervals[self.mastery_level]
+            new_level = min(5, self.mastery_level + 1)
+            delta = _INTERVALS[new_level]
         else:
-            self.incorrect_count += 1
-            self.mastery_level = max(0, self.mastery_level - 1)
-            days = 1  # Review again tomorrow
+            new_level = max(0, self.mastery_level - 1)
+            delta = _INTERVALS[0]  # Review again tomorrow
         
-        self.last_reviewed = timezone.now()
-        self.next_review = timezone.now() + timedelta(days=days)
-        self.save()
+        # One targeted UPDATE instead of writing every column back
+        now = timezone.now()
+        UserProgress.objects.filter(pk=self.pk).update(
+            mastery_level=new_level,
+            correct_count=models.F('correct_count') + int(is_correct),
+            incorrect_count=models.F('incorrect_count') + int(not is_correct),
+            last_reviewed=now,
+            next_review=now + delta,
+        )
+        self.mastery_level = new_level
+        self.correct_count += int(is_correct)
+        self.incorrect_count += int(not is_correct)
+        self.last_reviewed = now
+        self.next_review = now + delta
+        return new_level
 
 class StudySession(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
@@ -321,11 +404,22 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth import login
 from django.contrib.auth.forms import UserCreationForm
-from django.http import JsonResponse
+from django.core.cache import cache
+from django.http import JsonResponse, StreamingHttpResponse
+from django.template.loader import get_template, render_to_string
 from django.utils import timezone
-from django.db.models import Q, Avg, Sum
-from .models import Word, UserProgress, StudySession, Language
-import random
+from django.db.models import Exists, F, OuterRef
+from django.utils.safestring import mark_safe
+from .models import Word, UserProgress, StudySession
+from collections import Counter
+from dataclasses import dataclass
+import json
+
+@dataclass(slots=True)
+class _PendingWord:
+    """Stand-in for a word the user has not started learning yet"""
+    word: Word
+    mastery_level: int = 0
 
 def register(request):
     if request.method == 'POST':
@@ -342,54 +436,85 @@ def register(request):
 def word_list(request):
     difficulty = request.GET.get('difficulty', '')
     
-    words = Word.objects.all()
+    words = Word.objects.only('id', 'word', 'translation', 'pronunciation', 'example_sentence', 'difficulty')
     if difficulty:
         words = words.filter(difficulty=difficulty)
     
-    # Get user progress for each word
+    # Get user progress for each word, fetching only the fields the template reads
     user_progress = {
-        p.word_id: p for p in UserProgress.objects.filter(user=request.user)
+        p.word_id: p
+        for p in UserProgress.objects.filter(user=request.user).only(
+            'word', 'mastery_level', 'correct_count', 'incorrect_count'
+        )
     }
     
-    words_with_progress = []
-    for word in words:
-        progress = user_progress.get(word.id)
-        words_with_progress.append({
-            'word': word,
-            'progress': progress
-        })
-    
-    context = {
-        'words_with_progress': words_with_progress,
-        'current_difficulty': difficulty,
-    }
-    return render(request, 'vocabulary/word_list.html', context)
+    # Render the page shell once, then stream one card at a time so the first
+    # bytes go out before the last row is fetched; peak memory stays bounded
+    shell = render_to_string('vocabulary/word_list.html', {'current_difficulty': difficulty}, request=request)
+    head, tail = shell.split('<!-- word-cards -->')
+    card_template = get_template('vocabulary/word_card.html')
+    
+    # Lazy pipeline: rows arrive via a server-side cursor in chunks and are
+    # paired with progress one at a time, never materializing the full list
+    words_with_progress = (
+        {'word': w, 'progress': user_progress.get(w.id)}
+        for w in words.iterator(chunk_size=200)
+    )
+    
+    def stream():
+        yield head
+        empty = True
+        for item in words_with_progress:
+            empty = False
+            yield card_template.render({'item': item})
+        if empty:
+            yield '<p class="no-data">No words found. Contact admin to add vocabulary.</p>'
+        yield tail
+    
+    return StreamingHttpResponse(stream(), content_type='text/html; charset=utf-8')
 
 @login_required
 def practice(request):
-    # Get words due for review or new words
-    due_words = UserProgress.objects.filter(
-        user=request.user,
-        next_review__lte=timezone.now()
-    ).select_related('word')[:10]
-    
-    # If not enough due words, add new ones
-    learned_word_ids = UserProgress.objects.filter(user=request.user).values_list('word_id', flat=True)
-    new_words = Word.objects.exclude(id__in=learned_word_ids)[:10 - len(due_words)]
-    
-    words = list(due_words) + [
-        type('obj', (object,), {'word': word, 'mastery_level': 0})() 
-        for word in new_words
-    ]
+    # The due/new word set only changes when the user answers, so cache the
+    # serialized payload per user; check_answer invalidates it
+    cache_key = f'practice:due:{request.user.id}'
+    words_payload = cache.get(cache_key)
+    if words_payload is None:
+        # Get words due for review or new words
+        due_words = UserProgress.objects.filter(
+            user=request.user,
+            next_review__lte=timezone.now()
+        ).select_related('word')[:10]
+        
+        # If not enough due words, add new ones (anti-join instead of a giant NOT IN list)
+        new_words = Word.objects.annotate(
+            learned=Exists(UserProgress.objects.filter(user=request.user, word_id=OuterRef('pk')))
+        ).filter(learned=False)[:10 - len(due_words)]
+        
+        words = list(due_words) + [_PendingWord(word=word) for word in new_words]
+        
+        # Serialize the word payload once; the template embeds it as one JSON blob
+        # instead of re-rendering every word through escapejs
+        words_payload = [
+            {
+                'id': entry.word.id,
+                'word': entry.word.word,
+                'translation': entry.word.translation,
+                'example': entry.word.example_sentence,
+            }
+            for entry in words
+        ]
+        cache.set(cache_key, words_payload, timeout=60)
     
-    if not words:
+    if not words_payload:
         return render(request, 'vocabulary/practice.html', {'no_words': True})
     
     # Start a new study session
     session = StudySession.objects.create(user=request.user)
     
     context = {
-        'words': [w if isinstance(w, UserProgress) else w.word for w in words],
+        'words': words_payload,
+        'words_json': mark_safe(json.dumps(words_payload).replace('<', '\\\\u003c').replace('>', '\\\\u003e').replace('&', '\\\\u0026')),
         'session_id': session.id,
     }
     return render(request, 'vocabulary/practice.html', context)
@@ -398,30 +523,34 @@ def practice(request):
 def check_answer(request):
     if request.method == 'POST':
         word_id = request.POST.get('word_id')
-        user_answer = request.POST.get('answer', '').strip().lower()
+        user_answer = request.POST.get('answer', '').strip().casefold()
         session_id = request.POST.get('session_id')
         
         word = get_object_or_404(Word, id=word_id)
-        is_correct = user_answer == word.translation.lower()
+        # Rows loaded through loaddata save raw and skip Word.save(), leaving
+        # the normalized column empty - fold the translation on the fly then
+        is_correct = user_answer == (word.translation_normalized or word.translation.casefold().strip())
         
         # Update or create progress
         progress, created = UserProgress.objects.get_or_create(
             user=request.user,
             word=word,
         )
-        progress.update_progress(is_correct)
+        mastery_level = progress.update_progress(is_correct)
         
-        # Update session
-        session = StudySession.objects.get(id=session_id)
-        session.words_practiced += 1
-        if is_correct:
-            session.correct_answers += 1
-        session.save()
+        # Update session counters in a single UPDATE, no read-modify-write
+        StudySession.objects.filter(id=session_id).update(
+            words_practiced=F('words_practiced') + 1,
+            correct_answers=F('correct_answers') + int(is_correct),
+        )
+        
+        # The answer changes what is due next, so drop the cached payload
+        cache.delete(f'practice:due:{request.user.id}')
         
         return JsonResponse({
             'correct': is_correct,
             'correct_answer': word.translation,
-            'mastery_level': progress.mastery_level,
+            'mastery_level': mastery_level,
             'example': word.example_sentence,
         })
     
@@ -429,24 +558,35 @@ def check_answer(request):
 
 @login_required
 def progress_view(request):
-    progress_items = UserProgress.objects.filter(user=request.user).select_related('word')
-    
-    # Calculate statistics
-    total_words = progress_items.count()
-    avg_mastery = progress_items.aggregate(Avg('mastery_level'))['mastery_level__avg'] or 0
+    # Fetch the rows once, trimmed to the columns the template reads, then
+    # derive every statistic from the in-memory list with no further SQL
+    progress_items = list(
+        UserProgress.objects.filter(user=request.user)
+        .select_related('word')
+        .only(
+            'mastery_level', 'correct_count', 'incorrect_count', 'next_review',
+            'word__word', 'word__translation',
+        )
+        .order_by('-mastery_level')
+    )
+    total_words = len(progress_items)
+    avg_mastery = sum(p.mastery_level for p in progress_items) / total_words if total_words else 0
     
-    sessions = StudySession.objects.filter(user=request.user).order_by('-start_time')[:10]
+    # Materialize the recent slice; the template counting the sliced queryset
+    # would otherwise issue a full-table COUNT per render
+    sessions = list(StudySession.objects.filter(user=request.user).order_by('-start_time')[:10])
+    total_sessions = StudySession.objects.filter(user=request.user).count()
     
-    # Words by mastery level
-    mastery_distribution = {}
-    for i in range(6):
-        mastery_distribution[i] = progress_items.filter(mastery_level=i).count()
+    # Words by mastery level, counted over the already-fetched rows
+    mastery_distribution = {i: 0 for i in range(6)}
+    mastery_distribution.update(Counter(p.mastery_level for p in progress_items))
     
     context = {
         'progress_items': progress_items,
         'total_words': total_words,
         'avg_mastery': round(avg_mastery, 1),
         'sessions': sessions,
+        'total_sessions': total_sessions,
         'mastery_distribution': mastery_distribution,
     }
     return render(request, 'vocabulary/progress.html', context)
@@ -501,13 +641,49 @@ class WordForm(forms.ModelForm):
         fields = ['language', 'word', 'translation', 'pronunciation', 'example_sentence', 'difficulty']
 '''
 
-BASE_HTML = '''<!DOCTYPE html>
+SEED_VOCAB_PY = '''
+import json
+from pathlib import Path
+from django.core.management.base import BaseCommand
+from vocabulary.models import Language, Word
+
+class Command(BaseCommand):
+    help = 'Seed languages and words from the bundled fixture using bulk_create'
+    
+    def handle(self, *args, **options):
+        fixture = Path('vocabulary/fixtures/initial_data.json')
+        rows = json.loads(fixture.read_bytes())
+        
+        languages = [
+            Language(pk=row['pk'], **row['fields'])
+            for row in rows if row['model'] == 'vocabulary.language'
+        ]
+        Language.objects.bulk_create(languages, batch_size=500, ignore_conflicts=True)
+        
+        words = []
+        for row in rows:
+            if row['model'] != 'vocabulary.word':
+                continue
+            fields = dict(row['fields'])
+            fields['language_id'] = fields.pop('language')
+            word = Word(pk=row['pk'], **fields)
+            # bulk_create bypasses Word.save(), so normalize here
+            word.translation_normalized = word.translation.casefold().strip()
+            words.append(word)
+        Word.objects.bulk_create(words, batch_size=500, ignore_conflicts=True)
+        
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {len(languages)} languages and {len(words)} words"
+        ))
+'''
+
+BASE_HTML = '''{% load static %}<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{% block title %}Language Learning App{% endblock %}</title>
-    <link rel="stylesheet" href="/static/css/style.css">
+    <link rel="stylesheet" href="{% static 'css/style.css' %}">
 </head>
 <body>
     <nav class="navbar">
@@ -541,7 +717,7 @@ BASE_HTML = '''<!DOCTYPE html>
         {% block content %}{% endblock %}
     </main>
     
-    <script src="/static/js/practice.js"></script>
+    <script src="{% static 'js/practice.js' %}"></script>
     {% block extra_js %}{% endblock %}
 </body>
 </html>
@@ -565,35 +741,34 @@ WORD_LIST_HTML = '''{% extends 'base.html' %}
 </div>
 
 <div class="word-grid">
-    {% for item in words_with_progress %}
-    <div class="word-card">
-        <div class="word-header">
-            <h3>{{ item.word.word }}</h3>
-            <span class="difficulty-badge difficulty-{{ item.word.difficulty }}">{{ item.word.get_difficulty_display }}</span>
-        </div>
-        <p class="translation">{{ item.word.translation }}</p>
-        {% if item.word.pronunciation %}
-        <p class="pronunciation">🔊 {{ item.word.pronunciation }}</p>
-        {% endif %}
-        {% if item.word.example_sentence %}
-        <p class="example">💬 {{ item.word.example_sentence }}</p>
-        {% endif %}
-        {% if item.progress %}
-        <div class="progress-bar-container">
-            <div class="progress-bar" style="width: {{ item.progress.mastery_level|mul:20 }}%"></div>
-        </div>
-        <p class="mastery-text">Mastery: {{ item.progress.mastery_level }}/5 ({{ item.progress.success_rate }}% success)</p>
-        {% else %}
-        <p class="new-word">🆕 New word</p>
-        {% endif %}
-    </div>
-    {% empty %}
-    <p class="no-data">No words found. Contact admin to add vocabulary.</p>
-    {% endfor %}
+    <!-- word-cards -->
 </div>
 {% endblock %}
 '''
 
+WORD_CARD_HTML = '''<div class="word-card">
+    <div class="word-header">
+        <h3>{{ item.word.word }}</h3>
+        <span class="difficulty-badge difficulty-{{ item.word.difficulty }}">{{ item.word.get_difficulty_display }}</span>
+    </div>
+    <p class="translation">{{ item.word.translation }}</p>
+    {% if item.word.pronunciation %}
+    <p class="pronunciation">🔊 {{ item.word.pronunciation }}</p>
+    {% endif %}
+    {% if item.word.example_sentence %}
+    <p class="example">💬 {{ item.word.example_sentence }}</p>
+    {% endif %}
+    {% if item.progress %}
+    <div class="progress-bar-container">
+        <div class="progress-bar" style="width: {{ item.progress.mastery_level|mul:20 }}%"></div>
+    </div>
+    <p class="mastery-text">Mastery: {{ item.progress.mastery_level }}/5 ({{ item.progress.success_rate }}% success)</p>
+    {% else %}
+    <p class="new-word">🆕 New word</p>
+    {% endif %}
+</div>
+'''
+
 PRACTICE_HTML = '''{% extends 'base.html' %}
 
 {% block title %}Practice{% endblock %}
@@ -634,21 +809,17 @@ PRACTICE_HTML = '''{% extends 'base.html' %}
 </div>
 
 <script>
-    const words = {{ words|safe|escapejs }};
     const sessionId = {{ session_id }};
+    const checkAnswerUrl = '{% url "check_answer" %}';
+    const checkAnswerHeaders = new Headers({
+        'Content-Type': 'application/x-www-form-urlencoded',
+        'X-CSRFToken': '{{ csrf_token }}'
+    });
     let currentIndex = 0;
     let score = 0;
+    let submitting = false;
     
-    const wordsData = [
-        {% for word in words %}
-        {
-            id: {{ word.id }},
-            word: "{{ word.word|escapejs }}",
-            translation: "{{ word.translation|escapejs }}",
-            example: "{{ word.example_sentence|escapejs }}"
-        }{% if not forloop.last %},{% endif %}
-        {% endfor %}
-    ];
+    const wordsData = {{ words_json }};
     
     function loadWord() {
         if (currentIndex >= wordsData.length) {
@@ -665,15 +836,16 @@ PRACTICE_HTML = '''{% extends 'base.html' %}
     }
     
     function checkAnswer() {
+        if (submitting) {
+            return;  // a held Enter key must not spam the endpoint
+        }
+        submitting = true;
         const answer = document.getElementById('answerInput').value;
         const word = wordsData[currentIndex];
         
-        fetch('{% url "check_answer" %}', {
+        fetch(checkAnswerUrl, {
             method: 'POST',
-            headers: {
-                'Content-Type': 'application/x-www-form-urlencoded',
-                'X-CSRFToken': '{{ csrf_token }}'
-            },
+            headers: checkAnswerHeaders,
             body: `word_id=${word.id}&answer=${encodeURIComponent(answer)}&session_id=${sessionId}`
         })
         .then(response => response.json())
@@ -703,6 +875,9 @@ PRACTICE_HTML = '''{% extends 'base.html' %}
             }
             
             feedback.style.display = 'flex';
+        })
+        .finally(() => {
+            submitting = false;
         });
     }
     
@@ -757,7 +932,7 @@ PROGRESS_HTML = '''{% extends 'base.html' %}
         <p>Avg Mastery Level</p>
     </div>
     <div class="stat-card">
-        <h3>{{ sessions.count }}</h3>
+        <h3>{{ total_sessions }}</h3>
         <p>Practice Sessions</p>
     </div>
 </div>
@@ -821,6 +996,20 @@ PROGRESS_HTML = '''{% extends 'base.html' %}
 {% endblock %}
 '''
 
+# Sample vocabulary kept as Python data; serialized to the fixture with orjson
+INITIAL_DATA = [
+    {'model': 'vocabulary.language', 'pk': 1, 'fields': {'code': 'es', 'name': 'Spanish'}},
+    {'model': 'vocabulary.language', 'pk': 2, 'fields': {'code': 'fr', 'name': 'French'}},
+    {'model': 'vocabulary.word', 'pk': 1, 'fields': {'language': 1, 'word': 'hola', 'translation': 'hello', 'pronunciation': 'OH-lah', 'example_sentence': 'Hola, como estas?', 'difficulty': 'beginner'}},
+    {'model': 'vocabulary.word', 'pk': 2, 'fields': {'language': 1, 'word': 'gracias', 'translation': 'thank you', 'pronunciation': 'GRAH-syahs', 'example_sentence': 'Muchas gracias por tu ayuda.', 'difficulty': 'beginner'}},
+    {'model': 'vocabulary.word', 'pk': 3, 'fields': {'language': 1, 'word': 'biblioteca', 'translation': 'library', 'pronunciation': 'bee-blyoh-TEH-kah', 'example_sentence': 'Estudio en la biblioteca.', 'difficulty': 'intermediate'}},
+    {'model': 'vocabulary.word', 'pk': 4, 'fields': {'language': 1, 'word': 'desarrollar', 'translation': 'to develop', 'pronunciation': 'deh-sah-rroh-YAHR', 'example_sentence': 'Quiero desarrollar mis habilidades.', 'difficulty': 'advanced'}},
+    {'model': 'vocabulary.word', 'pk': 5, 'fields': {'language': 2, 'word': 'bonjour', 'translation': 'hello', 'pronunciation': 'bohn-ZHOOR', 'example_sentence': 'Bonjour, comment allez-vous?', 'difficulty': 'beginner'}},
+    {'model': 'vocabulary.word', 'pk': 6, 'fields': {'language': 2, 'word': 'merci', 'translation': 'thank you', 'pronunciation': 'mehr-SEE', 'example_sentence': 'Merci beaucoup pour votre aide.', 'difficulty': 'beginner'}},
+    {'model': 'vocabulary.word', 'pk': 7, 'fields': {'language': 2, 'word': 'bibliotheque', 'translation': 'library', 'pronunciation': 'bee-blee-oh-TEK', 'example_sentence': 'Je travaille a la bibliotheque.', 'difficulty': 'intermediate'}},
+    {'model': 'vocabulary.word', 'pk': 8, 'fields': {'language': 2, 'word': 'developper', 'translation': 'to develop', 'pronunciation': 'day-vel-oh-PAY', 'example_sentence': 'Je veux developper mes competences.', 'difficulty': 'advanced'}},
+]
+
 LOGIN_HTML = '''{% extends 'base.html' %}
 
 {% block title %}Login{% endblock %}